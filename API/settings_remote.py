@@ -55,12 +55,29 @@ GDAL_LIBRARY_PATH = os.environ.get('GDAL_LIBRARY_PATH')
 
 # https://docs.djangoproject.com/en/1.10/ref/settings/#databases
 # Heroku Database
+# conn_max_age keeps connections open between requests so each one skips the connection setup
 DATABASES = {
-    'default': dj_database_url.config(default=os.environ['DATABASE_URL'])
+    'default': dj_database_url.config(default=os.environ['DATABASE_URL'], conn_max_age=600)
 }
 # Add PostGIS engine
 DATABASES['default']['ENGINE'] = 'django.contrib.gis.db.backends.postgis' 
 
+# Shared cache for the camera list so every gunicorn worker and dyno sees the
+# invalidation done by CAM2API.signals. Without REDIS_URL (Heroku Redis add-on)
+# Django falls back to a per-process memory cache, and workers other than the
+# one that handled a write can serve a stale camera list for up to
+# CAMERA_LIST_CACHE_TIMEOUT (5 minutes).
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            },
+        }
+    }
+
 ALLOWED_HOSTS = ["*"]
 
 # Default Set of DEBUG is False
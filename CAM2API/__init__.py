@@ -0,0 +1 @@
+default_app_config = 'CAM2API.apps.Cam2ApiConfig'
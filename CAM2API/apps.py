@@ -5,3 +5,7 @@ from django.apps import AppConfig
 
 class Cam2ApiConfig(AppConfig):
     name = 'CAM2API'
+
+    def ready(self):
+        # Connects the camera list cache invalidation receivers
+        from CAM2API import signals
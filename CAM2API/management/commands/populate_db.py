@@ -3,6 +3,7 @@ from CAM2API.models import Camera, Non_IP, IP
 from django.contrib.gis.geos import GEOSGeometry
 from django.utils import timezone
 from django.core import management
+from CAM2API.signals import clear_camera_list_cache
 
 class Command(BaseCommand):
 	help = 'This script populates database with some fake data'
@@ -23,6 +24,7 @@ class Command(BaseCommand):
 		#WARNING!!! Erases all data from the database!!
 		print("Deleting all database entries")
 		management.call_command('flush', verbosity=0, interactive=False)
+		clear_camera_list_cache() #flush deletes rows without sending post_delete
 		print("Creating new database entries")
 		self._create_data()
 		print("Database successfully populated")
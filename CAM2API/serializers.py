@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from CAM2API.models import Camera, IP, Non_IP
 from django.core.exceptions import ValidationError
-from django.contrib.gis.geos import GEOSGeometry
+from django.contrib.gis.geos import Point
+import math
 import re 
 import geocoder
 import sys
@@ -47,7 +48,7 @@ class CameraSerializer(serializers.ModelSerializer):
 
 	def create(self, validated_data):
 		retrieval_data = validated_data.pop('retrieval_model')
-		if 'url' in retrieval_data.keys():
+		if 'url' in retrieval_data:
 			retrieval_model = Non_IP.objects.create(url=retrieval_data['url'])
 		else:
 			retrieval_model = IP.objects.create(**retrieval_data)
@@ -104,9 +105,14 @@ class CameraSerializer(serializers.ModelSerializer):
 			return NonIPSerializer(instance).data 		#Use NonIPSerializer if retrieval_model object is Non_IP object
 	
 	def set_lat_lng(self, data):
-		lat_lng = '{{ "type": "Point", "coordinates": [ {}, {} ] }}'.format(data.get('lat',None), data.get('lng',None))
-		lat_lng = GEOSGeometry(lat_lng)
-		return lat_lng
+		lat, lng = data.get('lat',None), data.get('lng',None)
+		try:
+			coordinates = (float(lat), float(lng))
+		except (TypeError, ValueError):
+			coordinates = None
+		if coordinates is None or not all(math.isfinite(value) for value in coordinates):
+			raise serializers.ValidationError({'lat_lng': ['lat and lng must be finite numbers, got {}, {}'.format(lat, lng)]})
+		return Point(*coordinates, srid=4326)	#Same point the GeoJSON [lat, lng] string used to produce, without the GDAL parse
 
 	def validate(self, data):
 		errors = []
@@ -0,0 +1,21 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from CAM2API.models import Camera
+
+# Serialized camera list cache used by CameraList.get
+CAMERA_LIST_CACHE_KEY = 'cameras:list'
+CAMERA_LIST_JSON_CACHE_KEY = 'cameras:list:json'
+CAMERA_LIST_CACHE_TIMEOUT = 60 * 5
+
+def clear_camera_list_cache():
+	"""
+	Drops the cached camera list so the next GET request re-reads the database
+	"""
+	cache.delete_many([CAMERA_LIST_CACHE_KEY, CAMERA_LIST_JSON_CACHE_KEY])
+
+@receiver(post_save, sender=Camera)
+@receiver(post_delete, sender=Camera)
+def camera_changed(sender, **kwargs):
+	clear_camera_list_cache()
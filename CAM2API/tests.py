@@ -1,6 +1,5 @@
 from django.test import TestCase
 from django.db import IntegrityError
-from django.contrib.gis.gdal.error import GDALException
 # Create your tests here.
 from django.core.management.base import BaseCommand
 from CAM2API.models import Camera, Non_IP, IP
@@ -10,6 +9,7 @@ from rest_framework.test import APITestCase
 from rest_framework.test import APIClient
 from rest_framework import status
 from rest_framework.reverse import reverse
+from django.core.cache import cache
 import json
 
 '''
@@ -18,6 +18,7 @@ Fixed Test Cases Index
 	#Basic Correctness Test
 		#Data for Test Case C1 - Correct IP Camera Test
 		#Data for Test Case C2 - Correct Non IP Camera Test
+		#Test Case C3 - Correct IP Camera Update Test
 
 	#Missing Information Test
 		#Data for Test Case E1 - Wrong IP Camera Without IP Test
@@ -34,6 +35,7 @@ Fixed Test Cases Index
 		#Data for Test Case E12 - Wrong Camera Without lng Test
 		#Data for Test Case E13 - Wrong Camera Without source Test
 		#Data for Test Case E14 - Wrong Camera Without source_url Test
+		#Data for Test Case E15 - Wrong Camera With Non-Finite lat Test
 
 
 	#Uniqueness Test
@@ -41,12 +43,19 @@ Fixed Test Cases Index
 
 	#Non Exist Camera Test
 		#Data for Test Case N1 - Wrong Camera ID to get Test
+
+	#Camera List Test
+		#Test Case L1 - Camera List Refresh Test
+		#Test Case L2 - Camera List Page Test
+		#Test Case L3 - Camera List Browsable API Test
 '''
 
 class API_View_Tests(APITestCase):
 
 	print(' ___________________________________Test Start(>_<)_________________________________')
 	def setUp(self):
+		#The camera list cache outlives each test's database rollback
+		cache.clear()
 		
 	#Basic Correctness Test
 
@@ -100,6 +109,9 @@ class API_View_Tests(APITestCase):
 		#Data for Test Case E14 - Wrong Camera Without source_url Test
 		self.data_E14 = {'lat':35.6895 ,'lng':139.6917,'city':'Shinjuku-ku','country':'JP','source':'google','last_updated':'2016-04-15 07:41:52','description':'This is a test camera','is_video':1,'framerate':0.3,'outdoors':True,'indoors':False,'traffic':False,'inactive':False,'resolution_w':1920,'resolution_h':1080,'ip':"192.168.1.1",'port':8000, 'camera_id':8015}
 
+		#Data for Test Case E15 - Wrong Camera With Non-Finite lat Test
+		self.data_E15 = dict(self.data_C1, lat='nan', camera_id=8019)
+
 
 #Uniqueness Test
 	#Data for Test Case U1 - Wrong duplicated Camera ID Test
@@ -132,6 +144,19 @@ class API_View_Tests(APITestCase):
 		self.assertEqual(response.status_code, 200)
 		self.assertEqual(response.data['city'], 'Shinjuku-ku')
 
+	#Test Case C3 - Correct IP Camera Update Test
+	def test_post_put_case_C3(self):
+		print('case_C3')
+		response = self.client.post('/cameras.json/',self.data_C1, format = 'json')
+		self.assertEqual(response.status_code,200)
+		data = dict(self.data_C1, description='This is an updated test camera')
+		response = self.client.put('/cameras/8000/', data, format = 'json')
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.data['description'], 'This is an updated test camera')
+		response = self.client.get('/cameras/8000/')
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.data['description'], 'This is an updated test camera')
+
 	#Test Case E1 - Wrong IP Camera Without IP Test
 	def test_post_get_case_E1(self):
 		print('case_E1')
@@ -252,21 +277,17 @@ class API_View_Tests(APITestCase):
 	def test_post_get_case_E11(self):
 		print('case_E11')
 		client = APIClient()
-		try:
-			response = self.client.post('/cameras.json/',self.data_E11, format = 'json')
-			self.assertEqual(response.status_code,404)
-		except GDALException:
-			pass
+		response = self.client.post('/cameras.json/',self.data_E11, format = 'json')
+		self.assertEqual(response.status_code,400)
+		self.assertIn('lat_lng', response.data)
 
 	#Data for Test Case E12 - Wrong Camera Without lng Test
 	def test_post_get_case_E12(self):
 		print('case_E12')
 		client = APIClient()
-		try:
-			response = self.client.post('/cameras.json/',self.data_E12, format = 'json')
-			self.assertEqual(response.status_code,404)
-		except GDALException:
-			pass
+		response = self.client.post('/cameras.json/',self.data_E12, format = 'json')
+		self.assertEqual(response.status_code,400)
+		self.assertIn('lat_lng', response.data)
 
 	#Test Case E13 - Wrong Camera Without source Test
 	def test_post_get_case_E13(self):
@@ -289,6 +310,15 @@ class API_View_Tests(APITestCase):
 			pass
 
 
+	#Test Case E15 - Wrong Camera With Non-Finite lat Test
+	def test_post_get_case_E15(self):
+		print('case_E15')
+		response = self.client.post('/cameras.json/',self.data_E15, format = 'json')
+		self.assertEqual(response.status_code,400)
+		self.assertIn('lat_lng', response.data)
+		response = self.client.get('/cameras/8019/')
+		self.assertEqual(response.status_code, 404)
+
 
 #Uniqueness Test
 	#Test Case U1 - Wrong duplicated Camera ID Test
@@ -316,3 +346,41 @@ class API_View_Tests(APITestCase):
 		response = self.client.get('/cameras/8018/')
 		self.assertEqual(response.status_code, 404)
 
+
+#Camera List Test
+	#Test Case L1 - Camera List Refresh Test
+	def test_post_list_case_L1(self):
+		print('case_L1')
+		response = self.client.get('/cameras/')
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(json.loads(response.content.decode()), [])
+		response = self.client.post('/cameras.json/',self.data_C1, format = 'json')
+		self.assertEqual(response.status_code,200)
+		response = self.client.get('/cameras/')
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual([camera['camera_id'] for camera in json.loads(response.content.decode())], [8000])
+		#A repeated GET is served from the cache without touching the database
+		with self.assertNumQueries(0):
+			response = self.client.get('/cameras/')
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual([camera['camera_id'] for camera in json.loads(response.content.decode())], [8000])
+
+	#Test Case L2 - Camera List Page Test
+	def test_post_list_case_L2(self):
+		print('case_L2')
+		response = self.client.post('/cameras.json/',self.data_C1, format = 'json')
+		self.assertEqual(response.status_code,200)
+		response = self.client.post('/cameras.json/',self.data_C2, format = 'json')
+		self.assertEqual(response.status_code,200)
+		response = self.client.get('/cameras/', {'limit':1, 'offset':1})
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.data['count'], 2)
+		self.assertEqual([camera['camera_id'] for camera in response.data['results']], [8001])
+
+	#Test Case L3 - Camera List Browsable API Test
+	def test_get_list_case_L3(self):
+		print('case_L3')
+		response = self.client.get('/cameras/', HTTP_ACCEPT='text/html')
+		self.assertEqual(response.status_code, 200)
+		response = self.client.get('/cameras/', {'limit':1}, HTTP_ACCEPT='text/html')
+		self.assertEqual(response.status_code, 200)
@@ -1,37 +1,79 @@
 # Import Models and Serializer
 from CAM2API.models import Camera, Non_IP, IP
 from CAM2API.serializers import CameraSerializer, IPSerializer, NonIPSerializer
+from CAM2API.signals import CAMERA_LIST_CACHE_KEY, CAMERA_LIST_JSON_CACHE_KEY, CAMERA_LIST_CACHE_TIMEOUT
 
 from django.contrib.gis.geos import GEOSGeometry
 
-from django.http import Http404
+from django.core.cache import cache
+from django.http import Http404, HttpResponse
 from rest_framework.views import APIView
+from rest_framework.renderers import JSONRenderer
 from rest_framework.generics import GenericAPIView
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.response import Response
 from rest_framework import status
 from django.db.models.query import QuerySet
 from django.shortcuts import get_object_or_404
 
-class CameraList(APIView):
+def convert_data(data):     #needs further modification to make it more explicit
+	"""
+	Moves the url or ip/port fields of a camera request into a nested retrieval_model
+	input data: request data for a camera
+	return: the same data with the retrieval_model field set
+	"""
+	url = data.pop("url", None)
+	if url is not None:
+		data["retrieval_model"] = {"url":url}
+	else:
+		ip = data.pop("ip", None)
+		if ip is not None:
+			port = data.pop("port", 80)
+			data["retrieval_model"] = {"ip":ip, "port":port}
+	return data
+
+class CameraList(GenericAPIView):
 	"""
 	Returns:
 		GET - JSON response containing all the camera data in the database
 		POST - Creates new camera objects in the database
 	"""
+	serializer_class = CameraSerializer
+	pagination_class = LimitOffsetPagination
+
+	def get_queryset(self):
+		cameras = Camera.objects.prefetch_related('retrieval_model') #retrieval_model is a GenericForeignKey so it can only be prefetched, not select_related
+		cameras = cameras.defer('lat_lng') #lat_lng is write only in CameraSerializer, lat and lng are returned instead
+		return cameras.order_by('pk') #pages need a stable order
+
 	def get(self, request, format=None):
 		"""
 		Returns JSON response containing all the camera data in the database
-		input request: HTTP GET request
+		input request: HTTP GET request, optionally with limit and offset query parameters
 		input format: optional format string included in HTTP request
-		return: JSON String
+		return: JSON String, a single page of cameras if a limit is given
 		"""
-		cameras = Camera.objects.all()
-		serializer = CameraSerializer(cameras, many=True)
-		return Response(serializer.data)
+		page = self.paginate_queryset(self.get_queryset())
+		if page is not None:
+			serializer = self.get_serializer(page, many=True)
+			return self.get_paginated_response(serializer.data)
+		if request.accepted_renderer.format == 'json':
+			#Serve the cached bytes directly so neither serialization nor rendering runs on a cache hit
+			payload = cache.get_or_set(CAMERA_LIST_JSON_CACHE_KEY, lambda: JSONRenderer().render(self.serialize_cameras()), CAMERA_LIST_CACHE_TIMEOUT)
+			return HttpResponse(payload, content_type='application/json')
+		return Response(cache.get_or_set(CAMERA_LIST_CACHE_KEY, self.serialize_cameras, CAMERA_LIST_CACHE_TIMEOUT))
+
+	def serialize_cameras(self):
+		"""
+		Serializes every camera in the database
+		return: list of camera dictionaries
+		"""
+		serializer = self.get_serializer(self.get_queryset(), many=True)
+		return serializer.data
 
 	def post(self, request, format=None):
-		data = self.convert_data(request.data)
-		serializer = CameraSerializer(data=data)
+		data = convert_data(request.data)
+		serializer = self.get_serializer(data=data)
 
 		if serializer.is_valid():
 			serializer.save()
@@ -39,20 +81,7 @@ class CameraList(APIView):
 			return Response(serializer.data)
 		else:	
 			print("Data not added")
-			return Response(serializer.errors)
-
-	def convert_data(self,data):     #needs further modification to make it more explicit
-		if "url" in data.keys():
-			url = data.pop("url")
-			data["retrieval_model"] = {"url":url}
-		elif "ip" in data.keys():
-			ip = data.pop("ip")
-			if "port" in data.keys():
-				port = data.pop("port")
-			else:
-				port = 80
-			data["retrieval_model"] = {"ip":ip, "port":port}
-		return data
+			return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class CameraDetail(APIView):
 	"""
@@ -95,7 +124,7 @@ class CameraDetail(APIView):
 				or a HTTP 400 error if the camera cannot be edited to the database
 		"""
 		camera = self.get_object()
-		data = self.convert_data(request.data)
+		data = convert_data(request.data)
 		print(data)
 		serializer = CameraSerializer(camera, data=data)
 		if serializer.is_valid():